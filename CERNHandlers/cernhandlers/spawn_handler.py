@@ -8,13 +8,15 @@ import os
 import io
 import requests
 import subprocess
+import select
+import threading
 from jupyterhub.handlers.base import BaseHandler
 from jupyterhub.utils import url_path_join
 from tornado import web
+from tornado.ioloop import IOLoop
 from tornado.httputil import url_concat
 from urllib.parse import parse_qs, unquote, urlparse
 from .handlers_configs import SpawnHandlersConfigs
-import datetime, calendar
 import pickle, struct
 from socket import (
     socket,
@@ -23,6 +25,53 @@ from socket import (
     gethostname,
 )
 
+# Short name of this host, used to tag the metrics
+_THIS_HOST = gethostname().split('.', 1)[0]
+
+# Slashes are not allowed in graphite metric names
+_SLASH_TR = str.maketrans('/', '_')
+
+# Connection to the metrics server, shared by all the handlers and reconnected when broken
+_graphite_conn = None
+_graphite_conn_lock = threading.Lock()
+
+
+def _graphite_connection(configs):
+    """
+    Return the shared connection to the metrics server, (re)connecting when needed.
+    Must be called with _graphite_conn_lock held.
+    """
+    global _graphite_conn
+
+    # The server never writes to us, so if the socket is readable it has been closed on the other side.
+    # poll() is used instead of select(), which fails on file descriptors above 1023
+    if _graphite_conn is not None:
+        poller = select.poll()
+        poller.register(_graphite_conn, select.POLLIN)
+        if poller.poll(0):
+            _close_graphite_connection()
+
+    if _graphite_conn is None:
+        conn = socket(AF_INET, SOCK_STREAM)
+        conn.settimeout(2)
+        try:
+            conn.connect((configs.graphite_server, configs.graphite_server_port_batch))
+        except:
+            conn.close()
+            raise
+        _graphite_conn = conn
+
+    return _graphite_conn
+
+
+def _close_graphite_connection():
+    global _graphite_conn
+
+    if _graphite_conn is not None:
+        _graphite_conn.close()
+        _graphite_conn = None
+
+
 class SpawnHandler(BaseHandler):
     """Handle spawning of single-user servers via form.
 
@@ -259,66 +308,89 @@ class SpawnHandler(BaseHandler):
         This will allow us to see what users are choosing from within Grafana.
         """
 
-        date = calendar.timegm(datetime.datetime.utcnow().timetuple())
-        host = gethostname().split('.')[0]
         configs = SpawnHandlersConfigs.instance()
+        host = _THIS_HOST
 
-        # Add options to the log and send as metrics
-        metrics = []
+        # Add options to the log
+        cleaned_values = {}
         for (key, value) in options.items():
-            if key == configs.user_script_env_field:
-                path = ".".join([configs.graphite_metric_path, host, 'spawn_form', key])
-                metrics.append((path, (date, 1 if value else 0)))
-            else:
-                value_cleaned = str(value).replace('/', '_')
+            if key != configs.user_script_env_field:
+                value_cleaned = str(value).translate(_SLASH_TR)
+                cleaned_values[key] = value_cleaned
 
-                self._log_metric(user.name, host, ".".join(['spawn_form', key]), value_cleaned)
+                self._log_metric(user.name, host, "spawn_form." + key, value_cleaned)
 
-                metric = ".".join([configs.graphite_metric_path, host, 'spawn_form', key, value_cleaned])
-                metrics.append((metric, (date, 1)))
-
-        spawn_context_key = ".".join([options[configs.lcg_rel_field], options[configs.spark_cluster_field]])
+        spawn_prefix = f"spawn.{options[configs.lcg_rel_field]}.{options[configs.spark_cluster_field]}."
         if not spawn_exception:
-            # Add spawn success (no exception) and duration to the log and send as metrics
+            # Add spawn success (no exception) and duration to the log
             spawn_exc_class = "None"
-            self._log_metric(user.name, host, ".".join(["spawn", spawn_context_key, "exception_class"]), spawn_exc_class)
-            self._log_metric(user.name, host, ".".join(["spawn", spawn_context_key, "duration_sec"]), spawn_duration_sec)
-            metrics.append((".".join([configs.graphite_metric_path, host, "spawn_exception", spawn_exc_class]), (date, 1)))
-            metrics.append((".".join([configs.graphite_metric_path, host, "spawn_duration_sec", str(spawn_duration_sec)]), (date, 1)))
+            self._log_metric(user.name, host, spawn_prefix + "exception_class", spawn_exc_class)
+            self._log_metric(user.name, host, spawn_prefix + "duration_sec", spawn_duration_sec)
         else:
-            # Log spawn exception (send exception as metric)
+            # Log spawn exception
             spawn_exc_class = spawn_exception.__class__.__name__
-            self._log_metric(user.name, host, ".".join(["spawn", spawn_context_key, "exception_class"]), spawn_exc_class)
-            self._log_metric(user.name, host, ".".join(["spawn", spawn_context_key, "exception_message"]), str(spawn_exception))
-            metrics.append((".".join([configs.graphite_metric_path, host, "spawn_exception", spawn_exc_class]), (date, 1)))
+            self._log_metric(user.name, host, spawn_prefix + "exception_class", spawn_exc_class)
+            self._log_metric(user.name, host, spawn_prefix + "exception_message", str(spawn_exception))
 
-        if configs.metrics_on:
-            self._send_graphite_metrics(metrics)
+        if not configs.metrics_on:
+            return
+
+        # Send options, spawn exception and (on success) duration as metrics
+        date = int(time.time())
+        base_path = f"{configs.graphite_metric_path}.{host}"
+        form_prefix = base_path + ".spawn_form."
+
+        metrics = []
+        for (key, value) in options.items():
+            if key == configs.user_script_env_field:
+                metrics.append((form_prefix + key, (date, 1 if value else 0)))
+            else:
+                metrics.append((form_prefix + key + "." + cleaned_values[key], (date, 1)))
+
+        metrics.append((base_path + ".spawn_exception." + spawn_exc_class, (date, 1)))
+        if not spawn_exception:
+            metrics.append((base_path + ".spawn_duration_sec." + str(spawn_duration_sec), (date, 1)))
+
+        self._send_graphite_metrics(metrics)
 
     def _log_metric(self, user, host, metric, value):
-        self.log.info("user: %s, host: %s, metric: %s, value: %s" % (user, host, metric, value))
+        self.log.info("user: %s, host: %s, metric: %s, value: %s", user, host, metric, value)
 
     def _send_graphite_metrics(self, metrics):
         """
         Send metrics to the metrics server for analysis in Grafana.
+        The message is sent from the default executor, so that a slow or unreachable server
+        does not block the event loop.
         """
 
         self.log.debug("sending metrics to graphite: %s", metrics)
 
-        try:
-            configs = SpawnHandlersConfigs.instance()
-            # Serialize the message and send everything in on single package
-            payload = pickle.dumps(metrics, protocol=2)
-            header = struct.pack("!L", len(payload))
-            message = header + payload
-
-            # Send the message
-            conn = socket(AF_INET, SOCK_STREAM)
-            conn.settimeout(2)
-            conn.connect((configs.graphite_server, configs.graphite_server_port_batch))
-            conn.send(message)
-            conn.close()
-        except Exception as ex:
-            self.log.error("Failed to send metrics: %s", ex, exc_info=True)
+        # Serialize the message, the header is sent separately to avoid copying the payload
+        payload = pickle.dumps(metrics, protocol=2)
+        header = struct.pack("!L", len(payload))
+
+        IOLoop.current().run_in_executor(None, self._send_graphite_message, header, payload)
+
+    def _send_graphite_message(self, header, payload):
+        """
+        Send an already serialized message to the metrics server (blocking).
+        """
+
+        def _send(conn):
+            conn.sendall(header)
+            conn.sendall(payload)
+
+        configs = SpawnHandlersConfigs.instance()
+        with _graphite_conn_lock:
+            try:
+                try:
+                    _send(_graphite_connection(configs))
+                except (BrokenPipeError, ConnectionResetError):
+                    # The server dropped the connection since the last send, retry once with a new one
+                    _close_graphite_connection()
+                    _send(_graphite_connection(configs))
+            except Exception as ex:
+                _close_graphite_connection()
+                self.log.error("Failed to send metrics: %s", ex, exc_info=True)
 
 
@@ -11,7 +11,6 @@ setup(name='swanspawner',
       install_requires=[
         'setuptools',
         'jupyterhub',
-        'psutil',
         'dockerspawner==0.11.0',
         'jupyterhub-kubespawner==0.10.1',
         'kubernetes==9.0.0' #kubespawnwer failing with version 10
@@ -3,10 +3,13 @@
 
 """CERN Specific Spawner class"""
 
+import asyncio
+import functools
 import re
 import os, pwd, subprocess
 import time
-from tornado import gen
+from collections import OrderedDict
+from tornado.ioloop import IOLoop
 from traitlets import (
     Unicode,
     Bool,
@@ -17,7 +20,6 @@ from traitlets import (
 
 import contextlib
 import random
-import psutil
 from socket import (
     socket,
     SO_REUSEADDR,
@@ -25,6 +27,96 @@ from socket import (
     gethostname,
 )
 
+# Short name of this host, used to tag the metrics
+_THIS_HOST = gethostname().split('.', 1)[0]
+
+_EXITCODE_RE = re.compile(r'ExitCode=(\d+)')
+
+class _ExpiringCache:
+    """
+        Small bounded mapping whose entries expire ttl seconds after being set.
+        The oldest entries are evicted once it holds more than maxsize of them.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if time.monotonic() > expires:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# uids are looked up again after 5 minutes, in case the passwd database changed
+_uid_cache = _ExpiringCache(maxsize=4096, ttl=300)
+
+
+def _uid_for(username):
+    """
+        Return the uid of username, caching the pwd lookup (which may hit LDAP)
+        so that users spawning repeatedly do not pay for it every time.
+    """
+    uid = _uid_cache.get(username)
+    if uid is None:
+        uid = pwd.getpwnam(username).pw_uid
+        _uid_cache.set(username, uid)
+    return uid
+
+
+# Ports handed to containers recently. Until Docker binds them they are in TIME_WAIT, which
+# SO_REUSEADDR lets us bind again, so they must not be given to another spawn meanwhile
+_recently_reserved_ports = _ExpiringCache(maxsize=65536, ttl=600)
+
+
+# Paths known to exist in CVMFS, checked again after 5 minutes
+_existing_paths = _ExpiringCache(maxsize=256, ttl=300)
+
+
+def _path_exists(path):
+    """
+        os.path.exists for paths that rarely change (e.g. LCG views in CVMFS), whose stat can be slow.
+        Only positive answers are cached: a missing path is checked again on every call, so that
+        spawns work again as soon as CVMFS recovers or a release gets published.
+    """
+    if _existing_paths.get(path):
+        return True
+    if os.path.exists(path):
+        _existing_paths.set(path, True)
+        return True
+    return False
+
+
+# Tokens are passed as env vars, which the kernel limits to 128KB each
+_TOKEN_MAX_BYTES = 64 * 1024
+
+
+def _read_token_file(path):
+    """
+        Read the content of a token file to be passed in the environment of the container.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        token = os.read(fd, _TOKEN_MAX_BYTES + 1)
+    finally:
+        os.close(fd)
+
+    if len(token) > _TOKEN_MAX_BYTES:
+        raise RuntimeError('Token file {} is bigger than {} bytes'.format(path, _TOKEN_MAX_BYTES))
+    return token.decode()
+
 
 def define_SwanSpawner_from(base_class):
     """
@@ -174,7 +266,7 @@ def define_SwanSpawner_from(base_class):
         def __init__(self, **kwargs):
             super().__init__(**kwargs)
             self.offload = False
-            self.this_host = gethostname().split('.')[0]
+            self.this_host = _THIS_HOST
 
         def options_from_form(self, formdata):
             options = {}
@@ -187,9 +279,12 @@ def define_SwanSpawner_from(base_class):
                 options[self.platform_field] = formdata[self.platform_field][0]
 
             options[self.user_script_env_field] = formdata[self.user_script_env_field][0]
-            options[self.spark_cluster_field]   = formdata[self.spark_cluster_field][0] if self.spark_cluster_field in formdata.keys() else 'none'
-            options[self.user_n_cores]          = int(formdata[self.user_n_cores][0]) if formdata[self.user_n_cores][0] in self.available_cores else int(self.available_cores[0])
-            options[self.user_memory]           = formdata[self.user_memory][0] + 'G' if formdata[self.user_memory][0] in self.available_memory else self.available_memory[0] + 'G'
+            options[self.spark_cluster_field]   = formdata[self.spark_cluster_field][0] if self.spark_cluster_field in formdata else 'none'
+
+            n_cores = formdata[self.user_n_cores][0]
+            memory = formdata[self.user_memory][0]
+            options[self.user_n_cores]          = int(n_cores) if n_cores in self.available_cores else int(self.available_cores[0])
+            options[self.user_memory]           = memory + 'G' if memory in self.available_memory else self.available_memory[0] + 'G'
 
             self.offload = options[self.spark_cluster_field] != 'none'
 
@@ -201,17 +296,19 @@ def define_SwanSpawner_from(base_class):
             """
             env = super().get_env()
 
-            username = self.user.name
-            userid = pwd.getpwnam(username).pw_uid
+            user = self.user
+            username = user.name
+            user_options = self.user_options
+            userid = _uid_for(username)
             if self.local_home:
-                homepath = "/scratch/%s" %(username)
+                homepath = f"/scratch/{username}"
             else:
                 homepath = self.eos_path_format.format(username = username)
 
             env.update(dict(
-                ROOT_LCG_VIEW_NAME     = self.user_options[self.lcg_rel_field],
-                ROOT_LCG_VIEW_PLATFORM = self.user_options[self.platform_field],
-                USER_ENV_SCRIPT        = self.user_options[self.user_script_env_field],
+                ROOT_LCG_VIEW_NAME     = user_options[self.lcg_rel_field],
+                ROOT_LCG_VIEW_PLATFORM = user_options[self.platform_field],
+                USER_ENV_SCRIPT        = user_options[self.user_script_env_field],
                 ROOT_LCG_VIEW_PATH     = self.lcg_view_path,
                 USER                   = username,
                 USER_ID                = str(userid),
@@ -219,9 +316,9 @@ def define_SwanSpawner_from(base_class):
                 EOS_PATH_FORMAT        = self.eos_path_format,
                 SERVER_HOSTNAME        = os.uname().nodename,
 
-                JPY_USER               = self.user.name,
-                JPY_COOKIE_NAME        = self.user.server.cookie_name,
-                JPY_BASE_URL           = self.user.base_url,
+                JPY_USER               = username,
+                JPY_COOKIE_NAME        = user.server.cookie_name,
+                JPY_BASE_URL           = user.base_url,
                 JPY_HUB_PREFIX         = self.hub.base_url,
                 JPY_HUB_API_URL        = self.hub.api_url
             ))
@@ -232,19 +329,19 @@ def define_SwanSpawner_from(base_class):
             # Only dockerspawner has these vars, and for now is the only one that needs this
             # code since we still don't have spark ready to work with a kubernetes deployment
             if hasattr(self, 'extra_host_config') and hasattr(self, 'extra_create_kwargs'):
-                # Clear old state
-                self.extra_host_config['port_bindings'] = {}
-                self.extra_create_kwargs['ports'] = []
+                # Built locally and set at the end, so that a failure does not leave them half populated
+                port_bindings = {}
+                ports = []
 
                 # Avoid overriding the default container output port, defined by the Spawner
                 if not self.use_internal_ip:
-                    self.extra_host_config['port_bindings'][self.port] = (self.host_ip,)
+                    port_bindings[self.port] = (self.host_ip,)
 
                 if self.offload:
-                    cluster = self.user_options[self.spark_cluster_field]
+                    cluster = user_options[self.spark_cluster_field]
                     env['SPARK_CLUSTER_NAME'] 		    = cluster
                     env['SPARK_USER'] 		            = username
-                    env['MAX_MEMORY']         	   	    = self.user_options[self.user_memory]
+                    env['MAX_MEMORY']         	   	    = user_options[self.user_memory]
 
                     if cluster == 'k8s':
                         env['SPARK_CONFIG_SCRIPT'] = self.k8s_config_script
@@ -255,22 +352,27 @@ def define_SwanSpawner_from(base_class):
                     # so that Spark can be exposed to the outside
                     # Reserves the ports so that other processes don't use them
                     # before Docker opens them
-                    spark_ports = []
-                    for _ in range(self.spark_session_num_ports * self.spark_max_sessions):
-                        try:
-                            reserved_port =  self.get_reserved_port(self.spark_session_port_range_start, self.spark_session_port_range_end)
-                        except Exception as ex:
-                            self.log.error("Error while allocating ports for Spark: %s", ex, exc_info=True)
-                            raise RuntimeError("Error while allocating ports for Spark. Please try again.")
-                        self.extra_host_config['port_bindings'][reserved_port] = reserved_port
-                        self.extra_create_kwargs['ports'].append(reserved_port)
-                        spark_ports.append(str(reserved_port))
-                    env["SPARK_PORTS"] = ",".join(spark_ports)
+                    try:
+                        reserved_ports = self.get_reserved_ports(
+                            self.spark_session_port_range_start,
+                            self.spark_session_port_range_end,
+                            self.spark_session_num_ports * self.spark_max_sessions
+                        )
+                    except Exception as ex:
+                        self.log.error("Error while allocating ports for Spark: %s", ex, exc_info=True)
+                        raise RuntimeError("Error while allocating ports for Spark. Please try again.")
+
+                    port_bindings.update(zip(reserved_ports, reserved_ports))
+                    ports = reserved_ports
+                    env["SPARK_PORTS"] = ",".join(map(str, reserved_ports))
+
+                # Replace old state
+                self.extra_host_config['port_bindings'] = port_bindings
+                self.extra_create_kwargs['ports'] = ports
 
             return env
 
-        @gen.coroutine
-        def stop(self, now=False):
+        async def stop(self, now=False):
             """ Overwrite default spawner to report stop of the container """
 
             if self._spawn_future and not self._spawn_future.done():
@@ -280,21 +382,20 @@ def define_SwanSpawner_from(base_class):
                 # Return 0 exit code as container got stopped after spawning correctly
                 container_exit_code = "0"
 
-            stop_result = yield super().stop(now)
+            stop_result = await super().stop(now)
 
             self._log_metric(
                 self.user.name,
                 self.this_host,
-                ".".join(["exit_container", "exit_code"]),
+                "exit_container.exit_code",
                 container_exit_code
             )
 
             return stop_result
 
-        @gen.coroutine
-        def poll(self):
+        async def poll(self):
             """ Overwrite default poll to get status of container """
-            container_exit_code = yield super().poll()
+            container_exit_code = await super().poll()
 
             # None if single - user process is running.
             # Integer exit code status, if it is not running and not stopped by JupyterHub.
@@ -303,7 +404,7 @@ def define_SwanSpawner_from(base_class):
                 if exit_return_code.isdigit():
                     value_cleaned = exit_return_code
                 else:
-                    result = re.search('ExitCode=(\d+)', exit_return_code)
+                    result = _EXITCODE_RE.search(exit_return_code)
                     if not result:
                         raise Exception("unknown exit code format for this Spawner")
                     value_cleaned = result.group(1)
@@ -311,41 +412,42 @@ def define_SwanSpawner_from(base_class):
                 self._log_metric(
                     self.user.name,
                     self.this_host,
-                    ".".join(["exit_container", "exit_code"]),
+                    "exit_container.exit_code",
                     value_cleaned
                 )
 
             return container_exit_code
 
-        @gen.coroutine
-        def start(self):
+        async def start(self):
             """Start the container and perform the operations necessary for mounting
             EOS, authenticating HDFS and authenticating K8S.
             """
 
             username = self.user.name
-            platform = self.user_options[self.platform_field]
-            lcg_rel = self.user_options[self.lcg_rel_field]
-            cluster = self.user_options[self.spark_cluster_field]
-            cpu_quota = self.user_options[self.user_n_cores]
-            mem_limit = self.user_options[self.user_memory]
+            user_options = self.user_options
+            platform = user_options[self.platform_field]
+            lcg_rel = user_options[self.lcg_rel_field]
+            cluster = user_options[self.spark_cluster_field]
+            cpu_quota = user_options[self.user_n_cores]
+            mem_limit = user_options[self.user_memory]
+            env = self.env
    
             try:
                 start_time_configure_user = time.time()
 
                 if not self.local_home and self.auth_script:
                     # When using CERNBox as home, obtain credentials for the user
-                    subprocess.call(['sudo', self.auth_script, username], timeout=60)
+                    await self._run_auth_script(self.auth_script, username)
                     self.log.debug("We are in SwanSpawner. Credentials for %s were requested.", username)
 
-                if self.check_cvmfs_status and not os.path.exists(self.lcg_view_path):
+                if self.check_cvmfs_status and not _path_exists(self.lcg_view_path):
                     raise RuntimeError(
                         """
                         Could not initialize software stack, please <a href="https://cern.ch/ssb" target="_blank">check service status</a> or <a href="https://cern.service-now.com/service-portal/function.do?name=swan" target="_blank">report an issue</a>
                         """
                     )
 
-                if self.check_cvmfs_status and not os.path.exists(self.lcg_view_path + '/' + lcg_rel + '/' + platform):
+                if self.check_cvmfs_status and not _path_exists(self.lcg_view_path + '/' + lcg_rel + '/' + platform):
                     raise ValueError(
                         """
                         Configuration not available: please select other <b>Software stack</b> and <b>Platform</b>.
@@ -353,7 +455,7 @@ def define_SwanSpawner_from(base_class):
                     )
 
                 self._log_metric(
-                    self.user.name,
+                    username,
                     self.this_host,
                     ".".join(["configure_user", lcg_rel, cluster, "duration_sec"]),
                     time.time() - start_time_configure_user
@@ -378,21 +480,36 @@ def define_SwanSpawner_from(base_class):
                     hadoop_container_path = '/spark'
 
                     # Ensure that env variables are properly cleared
-                    self.env.pop('WEBHDFS_TOKEN', None)
-                    self.env.pop('HADOOP_TOKEN_FILE_LOCATION', None)
-                    self.env.pop('KUBECONFIG', None)
+                    env.pop('WEBHDFS_TOKEN', None)
+                    env.pop('HADOOP_TOKEN_FILE_LOCATION', None)
+                    env.pop('KUBECONFIG', None)
 
                     # Set authentication and authorization for the user
                     if cluster == 'k8s':
-                        subprocess.call([
-                            'sudo',
-                            self.init_k8s_user,
-                            username
-                        ], timeout=60)
-
-                        # set location of user kubeconfig for Spark
-                        if os.path.exists(hadoop_host_path + '/k8s-user.config'):
-                            self.env['KUBECONFIG'] = hadoop_container_path + '/k8s-user.config'
+                        # k8s and hadoop authentications are independent, run them in parallel
+                        await asyncio.gather(
+                            self._run_auth_script(self.init_k8s_user, username),
+                            self._run_auth_script(self.hadoop_auth_script, 'analytix', username)
+                        )
+
+                        # Set default EOS krb5 cache location to hadoop container path for k8s
+                        env['KRB5CCNAME'] = hadoop_container_path + '/krb5cc'
+                    else:
+                        await self._run_auth_script(self.hadoop_auth_script, cluster, username)
+
+                        # Set default location for krb5cc in tmp directory for yarn
+                        env['KRB5CCNAME'] = '/tmp/krb5cc'
+
+                    # List the generated files at once, as the directory might be on a network filesystem
+                    try:
+                        hadoop_host_files = set(os.listdir(hadoop_host_path))
+                    except OSError:
+                        hadoop_host_files = set()
+
+                    # set location of user kubeconfig for Spark
+                    if cluster == 'k8s':
+                        if 'k8s-user.config' in hadoop_host_files:
+                            env['KUBECONFIG'] = hadoop_container_path + '/k8s-user.config'
                         else:
                             raise RuntimeError(
                                 """
@@ -401,31 +518,10 @@ def define_SwanSpawner_from(base_class):
                                 """
                             )
 
-                        subprocess.call([
-                            'sudo',
-                            self.hadoop_auth_script,
-                            'analytix',
-                            username
-                        ], timeout=60)
-
-                        # Set default EOS krb5 cache location to hadoop container path for k8s
-                        self.env['KRB5CCNAME'] = hadoop_container_path + '/krb5cc'
-                    else:
-                        subprocess.call([
-                            'sudo',
-                            self.hadoop_auth_script,
-                            cluster,
-                            username
-                        ], timeout=60)
-
-                        # Set default location for krb5cc in tmp directory for yarn
-                        self.env['KRB5CCNAME'] = '/tmp/krb5cc'
-
                     # set location of hadoop token file and webhdfs token for Spark
-                    if os.path.exists(hadoop_host_path + '/hadoop.toks') and os.path.exists(hadoop_host_path + '/webhdfs.toks'):
-                        self.env['HADOOP_TOKEN_FILE_LOCATION'] = hadoop_container_path + '/hadoop.toks'
-                        with open(hadoop_host_path + '/webhdfs.toks', 'r') as webhdfs_token_file:
-                            self.env['WEBHDFS_TOKEN'] = webhdfs_token_file.read()
+                    if 'hadoop.toks' in hadoop_host_files and 'webhdfs.toks' in hadoop_host_files:
+                        env['HADOOP_TOKEN_FILE_LOCATION'] = hadoop_container_path + '/hadoop.toks'
+                        env['WEBHDFS_TOKEN'] = _read_token_file(hadoop_host_path + '/webhdfs.toks')
                     else:
                         if cluster == 'hadoop-nxcals':
                             raise ValueError(
@@ -447,7 +543,7 @@ def define_SwanSpawner_from(base_class):
                             )
 
                     self._log_metric(
-                        self.user.name,
+                        username,
                         self.this_host,
                         ".".join(["configure_spark", lcg_rel, cluster, "duration_sec"]),
                         time.time() - start_time_configure_spark
@@ -467,15 +563,15 @@ def define_SwanSpawner_from(base_class):
 
                 # Temporary fix to have both slc6 and cc7 image available. It should be removed
                 # as soon as we move to cc7 completely.
-                if "slc6" in self.user_options[self.platform_field]:
+                if "slc6" in platform:
                     self.image = self.image_slc6
 
                 # Enabling GPU for cuda stacks
                 # Options to export nvidia device can be found in https://github.com/NVIDIA/nvidia-container-runtime#nvidia_require_
-                if "cu" in self.user_options[self.lcg_rel_field]:
-                    self.env['NVIDIA_VISIBLE_DEVICES']='all'  # We are making visible all the devices, if the host has more that one can be used.
-                    self.env['NVIDIA_DRIVER_CAPABILITIES']='compute,utility'
-                    self.env['NVIDIA_REQUIRE_CUDA']='cuda>=10.0 driver>=410'
+                if "cu" in lcg_rel:
+                    env['NVIDIA_VISIBLE_DEVICES']='all'  # We are making visible all the devices, if the host has more that one can be used.
+                    env['NVIDIA_DRIVER_CAPABILITIES']='compute,utility'
+                    env['NVIDIA_REQUIRE_CUDA']='cuda>=10.0 driver>=410'
                     if hasattr(self, 'extra_host_config'): # for docker but not for kuberneters
                         self.extra_host_config.update({'runtime' : 'nvidia'})
                     if hasattr(self, 'extra_resource_guarantees'): # for kubernetes but not for docker
@@ -486,11 +582,11 @@ def define_SwanSpawner_from(base_class):
                 start_time_start_container = time.time()
 
                 # start configured container
-                startup = yield super().start()
+                startup = await super().start()
 
                 # log container start success metrics
                 self._log_metric(
-                    self.user.name,
+                    username,
                     self.this_host,
                     ".".join(["start_container", lcg_rel, cluster, "duration_sec"]),
                     time.time() - start_time_start_container
@@ -525,10 +621,16 @@ def define_SwanSpawner_from(base_class):
 
         def get_volumes(self, only_mount=False):
 
+            # The same paths usually appear in several volumes, format each one once
+            fmt_cache = {}
+
             def _fmt(v):
-                return self.format_volume_name(v, self)
+                if v not in fmt_cache:
+                    fmt_cache[v] = self.format_volume_name(v, self)
+                return fmt_cache[v]
 
-            def _convert_list(volumes, binds, mode="rw"):
+            binds = []
+            for volumes, mode in ((self.volumes, "rw"), (self.read_only_volumes, "ro"), (self.shared_volumes, "shared")):
                 for k, v in volumes.items():
                     m = mode
                     if isinstance(v, dict):
@@ -539,47 +641,72 @@ def define_SwanSpawner_from(base_class):
                     if only_mount:
                         binds.append(_fmt(v))
                     else:
-                        binds.append("%s:%s:%s" % (_fmt(k), _fmt(v), m))
-                return binds
-
-            binds = _convert_list(self.volumes, [])
-            binds = _convert_list(self.read_only_volumes, binds, mode="ro")
-            return _convert_list(self.shared_volumes, binds, mode="shared")
+                        binds.append(f"{_fmt(k)}:{_fmt(v)}:{m}")
+            return binds
 
         @staticmethod
-        def get_reserved_port(start, end, n_tries=10):
+        def get_reserved_ports(start, end, n):
             """
-                Reserve a random available port.
-                It puts the door in TIME_WAIT state so that no other process gets it when asking for a random port,
-                but allows processes to bind to it, due to the SO_REUSEADDR flag.
+                Reserve n available ports from the [start, end] range, in a single shuffled pass over it.
+                Ports with a listening socket on any address, or handed out by this hub in the last
+                minutes (see _recently_reserved_ports), are skipped.
+                The ports are put in TIME_WAIT state, so that the kernel does not give them out as
+                ephemeral ports, while Docker can still bind them thanks to the SO_REUSEADDR flag.
+                This does not stop another process from explicitly binding them with SO_REUSEADDR.
                 From https://github.com/Yelp/ephemeral-port-reserve
             """
-            for i in range(n_tries):
-                try:
-                    with contextlib.closing(socket()) as s:
-                        port = random.randint(start, end)
-                        net_connections = psutil.net_connections()
-                        # look through the list of active connections to check if the port is being used or not and return FREE if port is unused
-                        if next((conn.laddr[1] for conn in net_connections if conn.laddr[1] == port),'FREE') != 'FREE':
-                            raise Exception('Port {} is in use'.format(port))
-                        s.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
-                        s.bind(('127.0.0.1', port))
+            ports = list(range(start, end + 1))
+            random.shuffle(ports)
 
-                        # the connect below deadlocks on kernel >= 4.4.0 unless this arg is greater than zero
-                        s.listen(1)
-
-                        sockname = s.getsockname()
-
-                        # these three are necessary just to get the port into a TIME_WAIT state
-                        with contextlib.closing(socket()) as s2:
-                            s2.connect(sockname)
-                            s.accept()
-                            return sockname[1]
-                except:
-                    if i == n_tries - 1:
-                        raise
+            sockets = []
+            try:
+                for port in ports:
+                    if len(sockets) == n:
+                        break
+                    if _recently_reserved_ports.get(port):
+                        continue
+                    s = socket()
+                    try:
+                        s.setsockopt(SOL_SOCKET, SO_REUSEADDR, 1)
+                        # fails with EADDRINUSE if another process is listening on the port, on any address
+                        s.bind(('', port))
+                    except OSError:
+                        s.close()
+                        continue
+                    sockets.append(s)
+
+                if len(sockets) < n:
+                    raise RuntimeError('Only {} of {} ports are available in range {}-{}'.format(len(sockets), n, start, end))
+
+                reserved_ports = []
+                for s in sockets:
+                    # the connect below deadlocks on kernel >= 4.4.0 unless this arg is greater than zero
+                    s.listen(1)
+
+                    port = s.getsockname()[1]
+
+                    # these three are necessary just to get the port into a TIME_WAIT state
+                    with contextlib.closing(socket()) as s2:
+                        s2.connect(('127.0.0.1', port))
+                        s.accept()[0].close()
+                    _recently_reserved_ports.set(port, True)
+                    reserved_ports.append(port)
+                return reserved_ports
+            finally:
+                for s in sockets:
+                    s.close()
+
+        def _run_auth_script(self, *args):
+            """
+                Run an authentication script with sudo in the default executor,
+                so that the event loop is not blocked while it runs.
+            """
+            return IOLoop.current().run_in_executor(
+                None,
+                functools.partial(subprocess.call, ['sudo', *args], timeout=60)
+            )
 
         def _log_metric(self, user, host, metric, value):
-            self.log.info("user: %s, host: %s, metric: %s, value: %s" % (user, host, metric, value))
+            self.log.info("user: %s, host: %s, metric: %s, value: %s", user, host, metric, value)
 
     return SwanSpawner